@@ -50,6 +50,7 @@ class Variable(getMetaClassBase("Variable")):
         "traces",
         "users",
         "writers",
+        "code_name",
     )
 
     @counted_init
@@ -70,6 +71,9 @@ class Variable(getMetaClassBase("Variable")):
         self.users = None
         self.writers = None
 
+        # Computed on demand, but then often used in code generation.
+        self.code_name = None
+
     if isCountingInstances():
         __del__ = counted_del()
 
@@ -103,11 +107,12 @@ class Variable(getMetaClassBase("Variable")):
         return self.owner.getEntryPoint()
 
     def getCodeName(self):
-        var_name = self.variable_name
-        var_name = var_name.replace(".", "$")
-        var_name = Utils.encodeNonAscii(var_name)
+        if self.code_name is None:
+            var_name = self.variable_name
+            var_name = var_name.replace(".", "$")
+            self.code_name = Utils.encodeNonAscii(var_name)
 
-        return var_name
+        return self.code_name
 
     def allocateTargetNumber(self):
         self.version_number += 1
@@ -24,8 +24,9 @@ from .Emission import SourceCodeCollector
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     getClosureCopyCode,
-    getFunctionCreationArgs,
+    getFunctionCreationArgSpec,
     getFunctionQualnameObj,
+    getHeapStorageCodes,
     setupFunctionLocalVariables,
 )
 from .Indentation import indented
@@ -36,17 +37,26 @@ from .templates.CodeTemplatesAsyncgens import (
     template_asyncgen_object_body,
     template_asyncgen_object_maker_template,
     template_asyncgen_return_exit,
-    template_make_asyncgen,
 )
+from .templates.CodeTemplatesFunction import template_make_function
 from .YieldCodes import getYieldReturnDispatchCode
 
 
+# Exit code templates, by need for exception exit and return exit.
+_asyncgen_exit_templates = {
+    (False, False): template_asyncgen_noexception_exit,
+    (False, True): template_asyncgen_noexception_exit + template_asyncgen_return_exit,
+    (True, False): template_asyncgen_exception_exit,
+    (True, True): template_asyncgen_exception_exit + template_asyncgen_return_exit,
+}
+
+
 def _getAsyncgenMakerIdentifier(function_identifier):
     return "MAKE_ASYNCGEN_" + function_identifier
 
 
 def getAsyncgenObjectDeclCode(function_identifier, closure_variables):
-    asyncgen_creation_args = getFunctionCreationArgs(
+    asyncgen_creation_args = getFunctionCreationArgSpec(
         defaults_name=None,
         kw_defaults_name=None,
         annotations_name=None,
@@ -55,7 +65,7 @@ def getAsyncgenObjectDeclCode(function_identifier, closure_variables):
 
     return template_asyncgen_object_maker_template % {
         "asyncgen_maker_identifier": _getAsyncgenMakerIdentifier(function_identifier),
-        "asyncgen_creation_args": ", ".join(asyncgen_creation_args),
+        "asyncgen_creation_args": asyncgen_creation_args,
     }
 
 
@@ -92,43 +102,24 @@ def getAsyncgenObjectCode(
 
     function_cleanup = finalizeFunctionLocalVariables(context)
 
+    exit_values = {"function_cleanup": indented(function_cleanup)}
+
     if needs_exception_exit:
         (
-            exception_type,
-            exception_value,
-            exception_tb,
+            exit_values["exception_type"],
+            exit_values["exception_value"],
+            exit_values["exception_tb"],
             _exception_lineno,
         ) = context.variable_storage.getExceptionVariableDescriptions()
 
-        generator_exit = template_asyncgen_exception_exit % {
-            "function_cleanup": indented(function_cleanup),
-            "exception_type": exception_type,
-            "exception_value": exception_value,
-            "exception_tb": exception_tb,
-        }
-    else:
-        generator_exit = template_asyncgen_noexception_exit % {
-            "function_cleanup": indented(function_cleanup)
-        }
-
-    if needs_generator_return:
-        generator_exit += template_asyncgen_return_exit % {}
+    exit_key = bool(needs_exception_exit), bool(needs_generator_return)
+    generator_exit = _asyncgen_exit_templates[exit_key] % exit_values
 
-    function_locals = context.variable_storage.makeCFunctionLevelDeclarations()
-
-    local_type_decl = context.variable_storage.makeCStructLevelDeclarations()
-    function_locals += context.variable_storage.makeCStructInits()
-
-    if local_type_decl:
-        heap_declaration = """\
-struct %(function_identifier)s_locals *asyncgen_heap = \
-(struct %(function_identifier)s_locals *)asyncgen->m_heap_storage;""" % {
-            "function_identifier": function_identifier
-        }
-    else:
-        heap_declaration = ""
+    function_locals, local_type_decl, heap_declaration = getHeapStorageCodes(
+        context=context, function_identifier=function_identifier
+    )
 
-    asyncgen_creation_args = getFunctionCreationArgs(
+    asyncgen_creation_args = getFunctionCreationArgSpec(
         defaults_name=None,
         kw_defaults_name=None,
         annotations_name=None,
@@ -143,11 +134,11 @@ struct %(function_identifier)s_locals *asyncgen_heap = \
         "function_var_inits": indented(function_locals),
         "function_dispatch": indented(getYieldReturnDispatchCode(context)),
         "asyncgen_maker_identifier": _getAsyncgenMakerIdentifier(function_identifier),
-        "asyncgen_creation_args": ", ".join(asyncgen_creation_args),
+        "asyncgen_creation_args": asyncgen_creation_args,
         "asyncgen_exit": generator_exit,
         "asyncgen_module": getModuleAccessCode(context),
         "asyncgen_name_obj": context.getConstantCode(
-            constant=asyncgen_object_body.getFunctionName()
+            asyncgen_object_body.getFunctionName()
         ),
         "asyncgen_qualname_obj": getFunctionQualnameObj(asyncgen_object_body, context),
         "code_identifier": context.getCodeObjectHandle(
@@ -167,18 +158,14 @@ def generateMakeAsyncgenObjectCode(to_name, expression, emit, context):
         closure_variables=closure_variables, context=context
     )
 
-    args = []
-    if closure_name:
-        args.append(closure_name)
-
     emit(
-        template_make_asyncgen
+        template_make_function
         % {
             "to_name": to_name,
-            "asyncgen_maker_identifier": _getAsyncgenMakerIdentifier(
+            "maker_identifier": _getAsyncgenMakerIdentifier(
                 asyncgen_object_body.getCodeName()
             ),
-            "args": ", ".join(str(arg) for arg in args),
+            "args": str(closure_name) if closure_name is not None else "",
             "closure_copy": indented(closure_copy, 0, True),
         }
     )
@@ -303,81 +303,62 @@ from .YieldCodes import (
 
 _generated_functions = {}
 
+# Context classes of function bodies with a fixed choice, by node kind.
+_function_body_context_classes = {
+    "EXPRESSION_GENERATOR_OBJECT_BODY": Contexts.PythonGeneratorObjectContext,
+    "EXPRESSION_CLASS_BODY": Contexts.PythonFunctionDirectContext,
+    "EXPRESSION_COROUTINE_OBJECT_BODY": Contexts.PythonCoroutineObjectContext,
+    "EXPRESSION_ASYNCGEN_OBJECT_BODY": Contexts.PythonAsyncgenObjectContext,
+}
+
+# Generator alike bodies have code and declaration functions with the same
+# interface each, by node kind.
+_generator_alike_body_codes = {
+    "EXPRESSION_GENERATOR_OBJECT_BODY": (
+        getGeneratorObjectCode,
+        getGeneratorObjectDeclCode,
+    ),
+    "EXPRESSION_COROUTINE_OBJECT_BODY": (
+        getCoroutineObjectCode,
+        getCoroutineObjectDeclCode,
+    ),
+    "EXPRESSION_ASYNCGEN_OBJECT_BODY": (
+        getAsyncgenObjectCode,
+        getAsyncgenObjectDeclCode,
+    ),
+}
+
 
 def generateFunctionBodyCode(function_body, context):
     # TODO: Generate both codes, and base direct/etc. decisions on context.
-    # pylint: disable=too-many-branches
 
     function_identifier = function_body.getCodeName()
 
     if function_identifier in _generated_functions:
         return _generated_functions[function_identifier]
 
-    if function_body.isExpressionGeneratorObjectBody():
-        function_context = Contexts.PythonGeneratorObjectContext(
-            parent=context, function=function_body
-        )
-    elif function_body.isExpressionClassBody():
-        function_context = Contexts.PythonFunctionDirectContext(
-            parent=context, function=function_body
-        )
-    elif function_body.isExpressionCoroutineObjectBody():
-        function_context = Contexts.PythonCoroutineObjectContext(
-            parent=context, function=function_body
-        )
-    elif function_body.isExpressionAsyncgenObjectBody():
-        function_context = Contexts.PythonAsyncgenObjectContext(
-            parent=context, function=function_body
-        )
-    elif function_body.needsCreation():
-        function_context = Contexts.PythonFunctionCreatedContext(
-            parent=context, function=function_body
-        )
-    else:
-        function_context = Contexts.PythonFunctionDirectContext(
-            parent=context, function=function_body
-        )
+    context_class = _function_body_context_classes.get(function_body.kind)
 
-    needs_exception_exit = function_body.mayRaiseException(BaseException)
+    if context_class is None:
+        if function_body.needsCreation():
+            context_class = Contexts.PythonFunctionCreatedContext
+        else:
+            context_class = Contexts.PythonFunctionDirectContext
 
-    if function_body.isExpressionGeneratorObjectBody():
-        function_code = getGeneratorObjectCode(
-            context=function_context,
-            function_identifier=function_identifier,
-            closure_variables=function_body.getClosureVariables(),
-            user_variables=function_body.getUserLocalVariables(),
-            outline_variables=function_body.getOutlineLocalVariables(),
-            temp_variables=function_body.getTempVariables(),
-            needs_exception_exit=needs_exception_exit,
-            needs_generator_return=function_body.needsGeneratorReturnExit(),
-        )
+    function_context = context_class(parent=context, function=function_body)
 
-        function_decl = getGeneratorObjectDeclCode(
-            function_identifier=function_identifier,
-            closure_variables=function_body.getClosureVariables(),
-        )
-    elif function_body.isExpressionCoroutineObjectBody():
-        function_code = getCoroutineObjectCode(
-            context=function_context,
-            function_identifier=function_identifier,
-            closure_variables=function_body.getClosureVariables(),
-            user_variables=function_body.getUserLocalVariables(),
-            outline_variables=function_body.getOutlineLocalVariables(),
-            temp_variables=function_body.getTempVariables(),
-            needs_exception_exit=needs_exception_exit,
-            needs_generator_return=function_body.needsGeneratorReturnExit(),
-        )
+    needs_exception_exit = function_body.mayRaiseException(BaseException)
+    closure_variables = function_body.getClosureVariables()
 
-        function_decl = getCoroutineObjectDeclCode(
-            function_identifier=function_body.getCodeName(),
-            closure_variables=function_body.getClosureVariables(),
-        )
+    generator_alike_body_codes = _generator_alike_body_codes.get(function_body.kind)
 
-    elif function_body.isExpressionAsyncgenObjectBody():
-        function_code = getAsyncgenObjectCode(
+    if generator_alike_body_codes is not None:
+        get_object_code, get_object_decl_code = generator_alike_body_codes
+
+        function_code = get_object_code(
             context=function_context,
             function_identifier=function_identifier,
-            closure_variables=function_body.getClosureVariables(),
+            closure_variables=closure_variables,
             user_variables=function_body.getUserLocalVariables(),
             outline_variables=function_body.getOutlineLocalVariables(),
             temp_variables=function_body.getTempVariables(),
@@ -385,9 +366,9 @@ def generateFunctionBodyCode(function_body, context):
             needs_generator_return=function_body.needsGeneratorReturnExit(),
         )
 
-        function_decl = getAsyncgenObjectDeclCode(
-            function_identifier=function_body.getCodeName(),
-            closure_variables=function_body.getClosureVariables(),
+        function_decl = get_object_decl_code(
+            function_identifier=function_identifier,
+            closure_variables=closure_variables,
         )
 
     elif function_body.isExpressionClassBody():
@@ -395,7 +376,7 @@ def generateFunctionBodyCode(function_body, context):
             context=function_context,
             function_identifier=function_identifier,
             parameters=None,
-            closure_variables=function_body.getClosureVariables(),
+            closure_variables=closure_variables,
             user_variables=function_body.getUserLocalVariables()
             + function_body.getOutlineLocalVariables(),
             temp_variables=function_body.getTempVariables(),
@@ -406,7 +387,7 @@ def generateFunctionBodyCode(function_body, context):
 
         function_decl = getFunctionDirectDecl(
             function_identifier=function_identifier,
-            closure_variables=function_body.getClosureVariables(),
+            closure_variables=closure_variables,
             file_scope=getExportScopeCode(cross_module=False),
             context=function_context,
         )
@@ -416,7 +397,7 @@ def generateFunctionBodyCode(function_body, context):
             context=function_context,
             function_identifier=function_identifier,
             parameters=function_body.getParameters(),
-            closure_variables=function_body.getClosureVariables(),
+            closure_variables=closure_variables,
             user_variables=function_body.getUserLocalVariables()
             + function_body.getOutlineLocalVariables(),
             temp_variables=function_body.getTempVariables(),
@@ -430,7 +411,7 @@ def generateFunctionBodyCode(function_body, context):
         if function_body.needsDirectCall():
             function_decl = getFunctionDirectDecl(
                 function_identifier=function_identifier,
-                closure_variables=function_body.getClosureVariables(),
+                closure_variables=closure_variables,
                 file_scope=getExportScopeCode(
                     cross_module=function_body.isCrossModuleUsed()
                 ),
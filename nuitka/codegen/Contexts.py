@@ -25,7 +25,7 @@ from abc import abstractmethod
 from contextlib import contextmanager
 
 from nuitka import Options
-from nuitka.__past__ import getMetaClassBase, iterItems
+from nuitka.__past__ import getMetaClassBase, iterItems, unicode
 from nuitka.Constants import isMutable
 from nuitka.constants.Serialization import ConstantAccessor
 from nuitka.PythonVersions import python_version
@@ -310,10 +310,23 @@ class CodeObjectsMixin(object):
         # Code objects needed made unique by a key.
         self.code_objects = {}
 
+        # Handles already given out for code object specs, these get asked
+        # for repeatedly, e.g. by frames and generator object makers.
+        self.code_object_handles = {}
+
     def getCodeObjects(self):
         return sorted(iterItems(self.code_objects))
 
     def getCodeObjectHandle(self, code_object):
+        result = self.code_object_handles.get(code_object)
+
+        if result is None:
+            result = self._getCodeObjectHandle(code_object)
+            self.code_object_handles[code_object] = result
+
+        return result
+
+    def _getCodeObjectHandle(self, code_object):
         key = CodeObjectHandle(
             co_filename=code_object.getFilename(),
             co_name=code_object.getCodeObjectName(),
@@ -543,7 +556,7 @@ class PythonChildContextBase(PythonContextBase):
         self.parent = parent
 
     def getConstantCode(self, constant, deep_check=False):
-        return self.parent.getConstantCode(constant, deep_check=deep_check)
+        return self.parent.getConstantCode(constant, deep_check)
 
     def getModuleCodeName(self):
         return self.parent.getModuleCodeName()
@@ -791,6 +804,10 @@ class PythonModuleContext(
             top_level_name="mod_consts", data_filename=data_filename
         )
 
+        # Names, qualnames and doc strings of functions are asked for very
+        # often, and looking them up in the accessor is not cheap.
+        self.string_constant_codes = {}
+
     def __repr__(self):
         return "<PythonModuleContext instance for module %s>" % self.name
 
@@ -845,6 +862,19 @@ class PythonModuleContext(
         if deep_check and Options.is_debug:
             assert not isMutable(constant)
 
+        # Only strings are cached, their equality is strict enough to be a key
+        # when combined with the type.
+        if type(constant) in (str, unicode):
+            key = type(constant), constant
+
+            result = self.string_constant_codes.get(key)
+
+            if result is None:
+                result = self.constant_accessor.getConstantCode(constant)
+                self.string_constant_codes[key] = result
+
+            return result
+
         return self.constant_accessor.getConstantCode(constant)
 
     def getConstantsCount(self):
@@ -29,8 +29,9 @@ from .ErrorCodes import getErrorExitCode
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     getClosureCopyCode,
-    getFunctionCreationArgs,
+    getFunctionCreationArgSpec,
     getFunctionQualnameObj,
+    getHeapStorageCodes,
     setupFunctionLocalVariables,
 )
 from .Indentation import indented
@@ -42,17 +43,26 @@ from .templates.CodeTemplatesCoroutines import (
     template_coroutine_object_body,
     template_coroutine_object_maker,
     template_coroutine_return_exit,
-    template_make_coroutine,
 )
+from .templates.CodeTemplatesFunction import template_make_function
 from .YieldCodes import getYieldReturnDispatchCode
 
 
+# Exit code templates, by need for exception exit and return exit.
+_coroutine_exit_templates = {
+    (False, False): template_coroutine_noexception_exit,
+    (False, True): template_coroutine_noexception_exit + template_coroutine_return_exit,
+    (True, False): template_coroutine_exception_exit,
+    (True, True): template_coroutine_exception_exit + template_coroutine_return_exit,
+}
+
+
 def _getCoroutineMakerIdentifier(function_identifier):
     return "MAKE_COROUTINE_" + function_identifier
 
 
 def getCoroutineObjectDeclCode(function_identifier, closure_variables):
-    coroutine_creation_args = getFunctionCreationArgs(
+    coroutine_creation_args = getFunctionCreationArgSpec(
         defaults_name=None,
         kw_defaults_name=None,
         annotations_name=None,
@@ -61,7 +71,7 @@ def getCoroutineObjectDeclCode(function_identifier, closure_variables):
 
     return template_coroutine_object_maker % {
         "coroutine_maker_identifier": _getCoroutineMakerIdentifier(function_identifier),
-        "coroutine_creation_args": ", ".join(coroutine_creation_args),
+        "coroutine_creation_args": coroutine_creation_args,
     }
 
 
@@ -98,45 +108,27 @@ def getCoroutineObjectCode(
 
     function_cleanup = finalizeFunctionLocalVariables(context)
 
+    exit_values = {"function_cleanup": indented(function_cleanup)}
+
     if needs_exception_exit:
         (
-            exception_type,
-            exception_value,
-            exception_tb,
+            exit_values["exception_type"],
+            exit_values["exception_value"],
+            exit_values["exception_tb"],
             _exception_lineno,
         ) = context.variable_storage.getExceptionVariableDescriptions()
 
-        generator_exit = template_coroutine_exception_exit % {
-            "function_cleanup": indented(function_cleanup),
-            "exception_type": exception_type,
-            "exception_value": exception_value,
-            "exception_tb": exception_tb,
-        }
-    else:
-        generator_exit = template_coroutine_noexception_exit % {
-            "function_cleanup": indented(function_cleanup)
-        }
-
     if needs_generator_return:
-        generator_exit += template_coroutine_return_exit % {
-            "return_value": context.getReturnValueName()
-        }
-
-    function_locals = context.variable_storage.makeCFunctionLevelDeclarations()
+        exit_values["return_value"] = context.getReturnValueName()
 
-    local_type_decl = context.variable_storage.makeCStructLevelDeclarations()
-    function_locals += context.variable_storage.makeCStructInits()
+    exit_key = bool(needs_exception_exit), bool(needs_generator_return)
+    generator_exit = _coroutine_exit_templates[exit_key] % exit_values
 
-    if local_type_decl:
-        heap_declaration = """\
-struct %(function_identifier)s_locals *coroutine_heap = \
-(struct %(function_identifier)s_locals *)coroutine->m_heap_storage;""" % {
-            "function_identifier": function_identifier
-        }
-    else:
-        heap_declaration = ""
+    function_locals, local_type_decl, heap_declaration = getHeapStorageCodes(
+        context=context, function_identifier=function_identifier
+    )
 
-    coroutine_creation_args = getFunctionCreationArgs(
+    coroutine_creation_args = getFunctionCreationArgSpec(
         defaults_name=None,
         kw_defaults_name=None,
         annotations_name=None,
@@ -151,11 +143,11 @@ struct %(function_identifier)s_locals *coroutine_heap = \
         "function_var_inits": indented(function_locals),
         "function_dispatch": indented(getYieldReturnDispatchCode(context)),
         "coroutine_maker_identifier": _getCoroutineMakerIdentifier(function_identifier),
-        "coroutine_creation_args": ", ".join(coroutine_creation_args),
+        "coroutine_creation_args": coroutine_creation_args,
         "coroutine_exit": generator_exit,
         "coroutine_module": getModuleAccessCode(context),
         "coroutine_name_obj": context.getConstantCode(
-            constant=coroutine_object_body.getFunctionName()
+            coroutine_object_body.getFunctionName()
         ),
         "coroutine_qualname_obj": getFunctionQualnameObj(
             coroutine_object_body, context
@@ -177,18 +169,14 @@ def generateMakeCoroutineObjectCode(to_name, expression, emit, context):
         closure_variables=closure_variables, context=context
     )
 
-    args = []
-    if closure_name:
-        args.append(closure_name)
-
     emit(
-        template_make_coroutine
+        template_make_function
         % {
             "to_name": to_name,
-            "coroutine_maker_identifier": _getCoroutineMakerIdentifier(
+            "maker_identifier": _getCoroutineMakerIdentifier(
                 coroutine_object_body.getCodeName()
             ),
-            "args": ", ".join(str(arg) for arg in args),
+            "args": str(closure_name) if closure_name is not None else "",
             "closure_copy": indented(closure_copy, 0, True),
         }
     )
@@ -38,6 +38,7 @@ from .templates.CodeTemplatesExceptions import (
     template_error_catch_quick_exception,
     template_error_format_name_error_exception,
     template_error_format_string_exception,
+    template_must_not_get_here,
 )
 
 
@@ -49,9 +50,11 @@ def getErrorExitReleaseCode(context):
     keeper_variables = context.getExceptionKeeperVariables()
 
     if keeper_variables[0] is not None:
-        temp_release += "\nPy_DECREF(%s);" % keeper_variables[0]
-        temp_release += "\nPy_XDECREF(%s);" % keeper_variables[1]
-        temp_release += "\nPy_XDECREF(%s);" % keeper_variables[2]
+        temp_release += "\nPy_DECREF(%s);\nPy_XDECREF(%s);\nPy_XDECREF(%s);" % (
+            keeper_variables[0],
+            keeper_variables[1],
+            keeper_variables[2],
+        )
 
     return temp_release
 
@@ -200,12 +203,7 @@ def getReleaseCodes(release_names, emit, context):
 
 
 def getMustNotGetHereCode(reason, emit):
-    emit(
-        """\
-NUITKA_CANNOT_GET_HERE("%s");
-return NULL;"""
-        % reason
-    )
+    emit(template_must_not_get_here % {"reason": reason})
 
 
 def getAssertionCode(check, emit):
@@ -38,6 +38,7 @@ from .LabelCodes import getGotoCode, getLabelCode
 from .LineNumberCodes import emitErrorLineNumberUpdateCode
 from .ModuleCodes import getModuleAccessCode
 from .PythonAPICodes import generateCAPIObjectCode, getReferenceExportCode
+from .templates.CodeTemplatesExceptions import template_must_not_get_here
 from .templates.CodeTemplatesFunction import (
     function_direct_body_template,
     template_function_body,
@@ -54,23 +55,53 @@ from .VariableCodes import (
     getLocalVariableDeclaration,
 )
 
+# Function bodies must return before reaching their end, the code to assert
+# that is always the same.
+_function_body_end_code = indented(
+    template_must_not_get_here
+    % {"reason": "Return statement must have exited already."}
+)
+
+# Qualname for functions existed for Python3, generators only after 3.5 and
+# coroutines and asyncgen for as long as they existed.
+_functions_have_qualname = python_version >= 0x300
+_generators_have_qualname = python_version >= 0x350
+
+# Creation arguments only depend on what is present, so there are only few
+# variants of the argument spec, which are computed once.
+_function_creation_arg_spec_cache = {}
 
-def getFunctionCreationArgs(
+
+def getFunctionCreationArgSpec(
     defaults_name, kw_defaults_name, annotations_name, closure_variables
 ):
-    result = []
+    key = (
+        defaults_name is not None,
+        kw_defaults_name is not None,
+        annotations_name is not None,
+        bool(closure_variables),
+    )
 
-    if defaults_name is not None:
-        result.append("PyObject *defaults")
+    result = _function_creation_arg_spec_cache.get(key)
 
-    if kw_defaults_name is not None:
-        result.append("PyObject *kw_defaults")
+    if result is None:
+        has_defaults, has_kw_defaults, has_annotations, has_closure = key
 
-    if annotations_name is not None:
-        result.append("PyObject *annotations")
+        result = []
+
+        if has_defaults:
+            result.append("PyObject *defaults")
+
+        if has_kw_defaults:
+            result.append("PyObject *kw_defaults")
+
+        if has_annotations:
+            result.append("PyObject *annotations")
+
+        if has_closure:
+            result.append("struct Nuitka_CellObject **closure")
 
-    if closure_variables:
-        result.append("struct Nuitka_CellObject **closure")
+        result = _function_creation_arg_spec_cache[key] = ", ".join(result)
 
     return result
 
@@ -83,7 +114,7 @@ def getFunctionMakerDecl(
     annotations_name,
 ):
 
-    function_creation_args = getFunctionCreationArgs(
+    function_creation_args = getFunctionCreationArgSpec(
         defaults_name=defaults_name,
         kw_defaults_name=kw_defaults_name,
         annotations_name=annotations_name,
@@ -92,7 +123,7 @@ def getFunctionMakerDecl(
 
     return template_function_make_declaration % {
         "function_identifier": function_identifier,
-        "function_creation_args": ", ".join(function_creation_args),
+        "function_creation_args": function_creation_args,
     }
 
 
@@ -115,11 +146,11 @@ def getFunctionQualnameObj(owner, context):
     """
 
     if owner.isExpressionFunctionBody():
-        min_version = 0x300
+        has_qualname = _functions_have_qualname
     else:
-        min_version = 0x350
+        has_qualname = _generators_have_qualname
 
-    if python_version < min_version:
+    if not has_qualname:
         return "NULL"
 
     function_qualname = owner.getFunctionQualname()
@@ -127,7 +158,7 @@ def getFunctionQualnameObj(owner, context):
     if function_qualname == owner.getFunctionName():
         return "NULL"
     else:
-        return context.getConstantCode(constant=function_qualname)
+        return context.getConstantCode(function_qualname)
 
 
 def getFunctionMakerCode(
@@ -142,7 +173,7 @@ def getFunctionMakerCode(
 ):
     # We really need this many parameters here and functions have many details,
     # that we express as variables, pylint: disable=too-many-locals
-    function_creation_args = getFunctionCreationArgs(
+    function_creation_args = getFunctionCreationArgSpec(
         defaults_name=defaults_name,
         kw_defaults_name=kw_defaults_name,
         annotations_name=annotations_name,
@@ -152,7 +183,7 @@ def getFunctionMakerCode(
     if function_doc is None:
         function_doc = "NULL"
     else:
-        function_doc = context.getConstantCode(constant=function_doc)
+        function_doc = context.getConstantCode(function_doc)
 
     (
         is_constant_returning,
@@ -190,14 +221,14 @@ def getFunctionMakerCode(
 
     module_identifier = getModuleAccessCode(context=context)
 
+    function_name_obj = context.getConstantCode(function_body.getFunctionName())
+
     result = template_maker_function_body % {
-        "function_name_obj": context.getConstantCode(
-            constant=function_body.getFunctionName()
-        ),
+        "function_name_obj": function_name_obj,
         "function_qualname_obj": getFunctionQualnameObj(function_body, context),
         "function_maker_identifier": function_maker_identifier,
         "function_impl_identifier": function_impl_identifier,
-        "function_creation_args": ", ".join(function_creation_args),
+        "function_creation_args": function_creation_args,
         "code_identifier": code_identifier,
         "function_doc": function_doc,
         "defaults": "defaults" if defaults_name else "NULL",
@@ -215,6 +246,37 @@ def getFunctionMakerCode(
     return result
 
 
+def _generateFunctionDefaultsCode(defaults, emit, context):
+    if defaults:
+        defaults_name = context.allocateTempName("defaults")
+
+        getTupleCreationCode(
+            to_name=defaults_name, elements=defaults, emit=emit, context=context
+        )
+    else:
+        defaults_name = None
+
+    return defaults_name
+
+
+def _generateFunctionKwDefaultsCode(kw_defaults, emit, context):
+    if kw_defaults:
+        kw_defaults_name = context.allocateTempName("kw_defaults")
+
+        assert not kw_defaults.isExpressionConstantDictEmptyRef(), kw_defaults
+
+        generateExpressionCode(
+            to_name=kw_defaults_name,
+            expression=kw_defaults,
+            emit=emit,
+            context=context,
+        )
+    else:
+        kw_defaults_name = None
+
+    return kw_defaults_name
+
+
 def generateFunctionCreationCode(to_name, expression, emit, context):
     # This is about creating functions, which is detail ridden stuff,
     # pylint: disable=too-many-locals
@@ -227,41 +289,12 @@ def generateFunctionCreationCode(to_name, expression, emit, context):
 
     assert function_body.needsCreation(), function_body
 
-    def handleKwDefaults():
-        if kw_defaults:
-            kw_defaults_name = context.allocateTempName("kw_defaults")
-
-            assert not kw_defaults.isExpressionConstantDictEmptyRef(), kw_defaults
-
-            generateExpressionCode(
-                to_name=kw_defaults_name,
-                expression=kw_defaults,
-                emit=emit,
-                context=context,
-            )
-        else:
-            kw_defaults_name = None
-
-        return kw_defaults_name
-
-    def handleDefaults():
-        if defaults:
-            defaults_name = context.allocateTempName("defaults")
-
-            getTupleCreationCode(
-                to_name=defaults_name, elements=defaults, emit=emit, context=context
-            )
-        else:
-            defaults_name = None
-
-        return defaults_name
-
     if defaults_first:
-        defaults_name = handleDefaults()
-        kw_defaults_name = handleKwDefaults()
+        defaults_name = _generateFunctionDefaultsCode(defaults, emit, context)
+        kw_defaults_name = _generateFunctionKwDefaultsCode(kw_defaults, emit, context)
     else:
-        kw_defaults_name = handleKwDefaults()
-        defaults_name = handleDefaults()
+        kw_defaults_name = _generateFunctionKwDefaultsCode(kw_defaults, emit, context)
+        defaults_name = _generateFunctionDefaultsCode(defaults, emit, context)
 
     if annotations:
         annotations_name = context.allocateTempName("annotations")
@@ -292,7 +325,7 @@ def generateFunctionCreationCode(to_name, expression, emit, context):
         context.addHelperCode(function_identifier, maker_code)
 
         function_decl = getFunctionMakerDecl(
-            function_identifier=function_body.getCodeName(),
+            function_identifier=function_identifier,
             closure_variables=closure_variables,
             defaults_name=defaults_name,
             kw_defaults_name=kw_defaults_name,
@@ -303,7 +336,7 @@ def generateFunctionCreationCode(to_name, expression, emit, context):
 
     getFunctionCreationCode(
         to_name=to_name,
-        function_identifier=function_body.getCodeName(),
+        function_identifier=function_identifier,
         defaults_name=defaults_name,
         kw_defaults_name=kw_defaults_name,
         annotations_name=annotations_name,
@@ -312,7 +345,8 @@ def generateFunctionCreationCode(to_name, expression, emit, context):
         context=context,
     )
 
-    getReleaseCode(release_name=annotations_name, emit=emit, context=context)
+    if annotations_name is not None:
+        getReleaseCode(release_name=annotations_name, emit=emit, context=context)
 
 
 def getClosureCopyCode(closure_variables, context):
@@ -320,28 +354,25 @@ def getClosureCopyCode(closure_variables, context):
 
     This gets used by generator/coroutine/asyncgen with varying "closure_type".
     """
-    if closure_variables:
-        closure_name = context.allocateTempName(
-            "closure", "struct Nuitka_CellObject *[%d]" % len(closure_variables)
-        )
-    else:
-        closure_name = None
+    if not closure_variables:
+        return None, []
+
+    closure_name = context.allocateTempName(
+        "closure", "struct Nuitka_CellObject *[%d]" % len(closure_variables)
+    )
 
     closure_copy = []
+    emit = closure_copy.append
 
     for count, (variable, variable_trace) in enumerate(closure_variables):
         variable_declaration = getLocalVariableDeclaration(
             context, variable, variable_trace
         )
 
-        target_cell_code = "%s[%d]" % (closure_name, count)
-
-        variable_c_type = variable_declaration.getCType()
-
-        variable_c_type.getCellObjectAssignmentCode(
-            target_cell_code=target_cell_code,
+        variable_declaration.getCType().getCellObjectAssignmentCode(
+            target_cell_code="%s[%d]" % (closure_name, count),
             variable_code_name=variable_declaration,
-            emit=closure_copy.append,
+            emit=emit,
         )
 
     return closure_name, closure_copy
@@ -384,18 +415,15 @@ def getFunctionCreationCode(
         template_make_function
         % {
             "to_name": to_name,
-            "function_maker_identifier": function_maker_identifier,
+            "maker_identifier": function_maker_identifier,
             "args": ", ".join(str(arg) for arg in args),
             "closure_copy": indented(closure_copy, 0, True),
         }
     )
 
-    if context.needsCleanup(defaults_name):
-        context.removeCleanupTempName(defaults_name)
-    if context.needsCleanup(kw_defaults_name):
-        context.removeCleanupTempName(kw_defaults_name)
-    if context.needsCleanup(annotations_name):
-        context.removeCleanupTempName(annotations_name)
+    for arg_name in (defaults_name, kw_defaults_name, annotations_name):
+        if arg_name is not None and context.needsCleanup(arg_name):
+            context.removeCleanupTempName(arg_name)
 
     # No error checks, this supposedly, cannot fail.
     context.addCleanupTempName(to_name)
@@ -414,20 +442,21 @@ def getDirectFunctionCallCode(
         function_identifier=function_identifier
     )
 
-    suffix_args = []
-
     # TODO: Does this still have to be a triple, we are stopping to use
     # versions later in the game.
-    for closure_variable, variable_trace in closure_variables:
-        variable_declaration = getLocalVariableDeclaration(
+    variable_declarations = [
+        getLocalVariableDeclaration(
             context=context, variable=closure_variable, variable_trace=variable_trace
         )
+        for closure_variable, variable_trace in closure_variables
+    ]
 
-        variable_c_type = variable_declaration.getCType()
-
-        suffix_args.append(
-            variable_c_type.getVariableArgReferencePassingCode(variable_declaration)
+    suffix_args = [
+        variable_declaration.getCType().getVariableArgReferencePassingCode(
+            variable_declaration
         )
+        for variable_declaration in variable_declarations
+    ]
 
     # TODO: We ought to not assume references for direct calls, or make a
     # profile if an argument needs a reference at all. Most functions don't
@@ -477,21 +506,30 @@ def getDirectFunctionCallCode(
     context.addCleanupTempName(to_name)
 
 
-def getFunctionDirectDecl(function_identifier, closure_variables, file_scope, context):
-    parameter_objects_decl = ["PyObject **python_pars"]
-
-    for closure_variable in closure_variables:
-        variable_declaration = getLocalVariableDeclaration(
+def _getClosureVariableArgDeclarations(context, closure_variables):
+    variable_declarations = [
+        getLocalVariableDeclaration(
             context=context,
             variable=closure_variable,
             variable_trace=None,  # TODO: See other uses of None
         )
+        for closure_variable in closure_variables
+    ]
 
-        variable_c_type = variable_declaration.getCType()
-
-        parameter_objects_decl.append(
-            variable_c_type.getVariableArgDeclarationCode(variable_declaration)
+    return [
+        variable_declaration.getCType().getVariableArgDeclarationCode(
+            variable_declaration
         )
+        for variable_declaration in variable_declarations
+    ]
+
+
+def getFunctionDirectDecl(function_identifier, closure_variables, file_scope, context):
+    parameter_objects_decl = ["PyObject **python_pars"]
+
+    parameter_objects_decl += _getClosureVariableArgDeclarations(
+        context=context, closure_variables=closure_variables
+    )
 
     result = template_function_direct_declaration % {
         "file_scope": file_scope,
@@ -552,7 +590,7 @@ def setupFunctionLocalVariables(
         )
 
         variable_declaration = context.variable_storage.addVariableDeclarationClosure(
-            variable_c_type.c_type, variable_code_name
+            variable_c_type.c_type, variable_code_name, closure_variable
         )
 
         assert variable_c_type in (
@@ -587,6 +625,35 @@ def finalizeFunctionLocalVariables(context):
     return function_cleanup
 
 
+def getHeapStorageCodes(context, function_identifier):
+    """Get code for local variables of generator/coroutine/asyncgen objects.
+
+    These store their local variables in heap storage, and the object kind
+    is derived from the context.
+    """
+    variable_storage = context.variable_storage
+
+    function_locals = variable_storage.makeCFunctionLevelDeclarations()
+
+    (
+        local_type_decl,
+        struct_inits,
+    ) = variable_storage.makeCStructLevelDeclarationsAndInits()
+    function_locals += struct_inits
+
+    if local_type_decl:
+        heap_declaration = """\
+struct %(function_identifier)s_locals *%(object_name)s_heap = \
+(struct %(function_identifier)s_locals *)%(object_name)s->m_heap_storage;""" % {
+            "function_identifier": function_identifier,
+            "object_name": context.getContextObjectName(),
+        }
+    else:
+        heap_declaration = ""
+
+    return function_locals, local_type_decl, heap_declaration
+
+
 def getFunctionCode(
     context,
     function_identifier,
@@ -651,18 +718,11 @@ def _getFunctionCode(
 
     function_locals = context.variable_storage.makeCFunctionLevelDeclarations()
 
-    function_doc = context.getConstantCode(constant=function_doc)
-
-    result = ""
-
-    emit = SourceCodeCollector()
+    function_doc = context.getConstantCode(function_doc)
 
-    getMustNotGetHereCode(
-        reason="Return statement must have exited already.", emit=emit
-    )
+    function_exit = [_function_body_end_code, "\n\n"]
 
-    function_exit = indented(emit.codes) + "\n\n"
-    del emit
+    function_cleanup = indented(function_cleanup)
 
     if needs_exception_exit:
         (
@@ -672,17 +732,22 @@ def _getFunctionCode(
             _exception_lineno,
         ) = context.variable_storage.getExceptionVariableDescriptions()
 
-        function_exit += template_function_exception_exit % {
-            "function_cleanup": indented(function_cleanup),
-            "exception_type": exception_type,
-            "exception_value": exception_value,
-            "exception_tb": exception_tb,
-        }
+        function_exit.append(
+            template_function_exception_exit
+            % {
+                "function_cleanup": function_cleanup,
+                "exception_type": exception_type,
+                "exception_value": exception_value,
+                "exception_tb": exception_tb,
+            }
+        )
 
     if context.hasTempName("return_value"):
-        function_exit += template_function_return_exit % {
-            "function_cleanup": indented(function_cleanup)
-        }
+        function_exit.append(
+            template_function_return_exit % {"function_cleanup": function_cleanup}
+        )
+
+    function_exit = "".join(function_exit)
 
     if context.isForCreatedFunction():
         parameter_objects_decl = ["struct Nuitka_FunctionObject const *self"]
@@ -692,20 +757,11 @@ def _getFunctionCode(
     parameter_objects_decl.append("PyObject **python_pars")
 
     if context.isForDirectCall():
-        for closure_variable in closure_variables:
-            variable_declaration = getLocalVariableDeclaration(
-                context=context,
-                variable=closure_variable,
-                variable_trace=None,  # TODO: See other uses of None.
-            )
-
-            variable_c_type = variable_declaration.getCType()
-
-            parameter_objects_decl.append(
-                variable_c_type.getVariableArgDeclarationCode(variable_declaration)
-            )
+        parameter_objects_decl += _getClosureVariableArgDeclarations(
+            context=context, closure_variables=closure_variables
+        )
 
-        result += function_direct_body_template % {
+        result = function_direct_body_template % {
             "file_scope": file_scope,
             "function_identifier": function_identifier,
             "direct_call_arg_spec": ", ".join(parameter_objects_decl),
@@ -714,7 +770,7 @@ def _getFunctionCode(
             "function_exit": function_exit,
         }
     else:
-        result += template_function_body % {
+        result = template_function_body % {
             "function_identifier": function_identifier,
             "parameter_objects_decl": ", ".join(parameter_objects_decl),
             "function_locals": indented(function_locals),
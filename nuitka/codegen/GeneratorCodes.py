@@ -26,12 +26,14 @@ from .Emission import SourceCodeCollector
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     getClosureCopyCode,
-    getFunctionCreationArgs,
+    getFunctionCreationArgSpec,
     getFunctionQualnameObj,
+    getHeapStorageCodes,
     setupFunctionLocalVariables,
 )
 from .Indentation import indented
 from .ModuleCodes import getModuleAccessCode
+from .templates.CodeTemplatesFunction import template_make_function
 from .templates.CodeTemplatesGeneratorFunction import (
     template_generator_exception_exit,
     template_generator_noexception_exit,
@@ -39,17 +41,28 @@ from .templates.CodeTemplatesGeneratorFunction import (
     template_genfunc_yielder_body_template,
     template_genfunc_yielder_maker_decl,
     template_make_empty_generator,
-    template_make_generator,
 )
 from .YieldCodes import getYieldReturnDispatchCode
 
+# Generators can only return values with Python3.
+_generators_return_values = python_version >= 0x300
+
+
+# Exit code templates, by need for exception exit and return exit.
+_generator_exit_templates = {
+    (False, False): template_generator_noexception_exit,
+    (False, True): template_generator_noexception_exit + template_generator_return_exit,
+    (True, False): template_generator_exception_exit,
+    (True, True): template_generator_exception_exit + template_generator_return_exit,
+}
+
 
 def _getGeneratorMakerIdentifier(function_identifier):
     return "MAKE_GENERATOR_" + function_identifier
 
 
 def getGeneratorObjectDeclCode(function_identifier, closure_variables):
-    generator_creation_args = getFunctionCreationArgs(
+    generator_creation_args = getFunctionCreationArgSpec(
         defaults_name=None,
         kw_defaults_name=None,
         annotations_name=None,
@@ -58,7 +71,7 @@ def getGeneratorObjectDeclCode(function_identifier, closure_variables):
 
     return template_genfunc_yielder_maker_decl % {
         "generator_maker_identifier": _getGeneratorMakerIdentifier(function_identifier),
-        "generator_creation_args": ", ".join(generator_creation_args),
+        "generator_creation_args": generator_creation_args,
     }
 
 
@@ -84,8 +97,10 @@ def getGeneratorObjectCode(
 
     function_codes = SourceCodeCollector()
 
+    generator_object_body = context.getOwner()
+
     generateStatementSequenceCode(
-        statement_sequence=context.getOwner().subnode_body,
+        statement_sequence=generator_object_body.subnode_body,
         allow_none=True,
         emit=function_codes,
         context=context,
@@ -93,49 +108,31 @@ def getGeneratorObjectCode(
 
     function_cleanup = finalizeFunctionLocalVariables(context)
 
+    exit_values = {"function_cleanup": indented(function_cleanup)}
+
     if needs_exception_exit:
         (
-            exception_type,
-            exception_value,
-            exception_tb,
+            exit_values["exception_type"],
+            exit_values["exception_value"],
+            exit_values["exception_tb"],
             _exception_lineno,
         ) = context.variable_storage.getExceptionVariableDescriptions()
 
-        generator_exit = template_generator_exception_exit % {
-            "function_cleanup": indented(function_cleanup),
-            "exception_type": exception_type,
-            "exception_value": exception_value,
-            "exception_tb": exception_tb,
-        }
-    else:
-        generator_exit = template_generator_noexception_exit % {
-            "function_cleanup": indented(function_cleanup)
-        }
-
     if needs_generator_return:
-        generator_exit += template_generator_return_exit % {
-            "return_value": context.getReturnValueName()
-            if python_version >= 0x300
+        exit_values["return_value"] = (
+            context.getReturnValueName()
+            if _generators_return_values
             else None
-        }
-
-    function_locals = context.variable_storage.makeCFunctionLevelDeclarations()
-
-    local_type_decl = context.variable_storage.makeCStructLevelDeclarations()
-    function_locals += context.variable_storage.makeCStructInits()
+        )
 
-    generator_object_body = context.getOwner()
+    exit_key = bool(needs_exception_exit), bool(needs_generator_return)
+    generator_exit = _generator_exit_templates[exit_key] % exit_values
 
-    if local_type_decl:
-        heap_declaration = """\
-struct %(function_identifier)s_locals *generator_heap = \
-(struct %(function_identifier)s_locals *)generator->m_heap_storage;""" % {
-            "function_identifier": function_identifier
-        }
-    else:
-        heap_declaration = ""
+    function_locals, local_type_decl, heap_declaration = getHeapStorageCodes(
+        context=context, function_identifier=function_identifier
+    )
 
-    generator_creation_args = getFunctionCreationArgs(
+    generator_creation_args = getFunctionCreationArgSpec(
         defaults_name=None,
         kw_defaults_name=None,
         annotations_name=None,
@@ -150,11 +147,11 @@ struct %(function_identifier)s_locals *generator_heap = \
         "function_var_inits": indented(function_locals),
         "function_dispatch": indented(getYieldReturnDispatchCode(context)),
         "generator_maker_identifier": _getGeneratorMakerIdentifier(function_identifier),
-        "generator_creation_args": ", ".join(generator_creation_args),
+        "generator_creation_args": generator_creation_args,
         "generator_exit": generator_exit,
         "generator_module": getModuleAccessCode(context),
         "generator_name_obj": context.getConstantCode(
-            constant=generator_object_body.getFunctionName()
+            generator_object_body.getFunctionName()
         ),
         "generator_qualname_obj": getFunctionQualnameObj(
             generator_object_body, context
@@ -176,10 +173,6 @@ def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
         closure_variables=closure_variables, context=context
     )
 
-    args = []
-    if closure_name:
-        args.append(closure_name)
-
     # Special case empty generators.
     if generator_object_body.subnode_body is None:
         emit(
@@ -189,7 +182,7 @@ def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
                 "to_name": to_name,
                 "generator_module": getModuleAccessCode(context),
                 "generator_name_obj": context.getConstantCode(
-                    constant=generator_object_body.getFunctionName()
+                    generator_object_body.getFunctionName()
                 ),
                 "generator_qualname_obj": getFunctionQualnameObj(
                     generator_object_body, context
@@ -203,13 +196,13 @@ def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
         )
     else:
         emit(
-            template_make_generator
+            template_make_function
             % {
-                "generator_maker_identifier": _getGeneratorMakerIdentifier(
+                "maker_identifier": _getGeneratorMakerIdentifier(
                     generator_object_body.getCodeName()
                 ),
                 "to_name": to_name,
-                "args": ", ".join(str(arg) for arg in args),
+                "args": str(closure_name) if closure_name is not None else "",
                 "closure_copy": indented(closure_copy, 0, True),
             }
         )
@@ -23,9 +23,13 @@ to be the same as in templates.
 
 
 def _indentedCode(codes, count):
+    if count == 0:
+        return "\n".join(codes)
+
+    prefix = " " * count
+
     return "\n".join(
-        " " * count + line if (line and not line.startswith("#")) else line
-        for line in codes
+        [prefix + line if (line and line[0] != "#") else line for line in codes]
     )
 
 
@@ -136,7 +136,7 @@ def generateCAPIObjectCode0(
 def getCAPIObjectCode(
     to_name, capi, arg_names, may_raise, conversion_check, ref_count, emit, context
 ):
-    release_names = tuple(arg_name for arg_name in arg_names if arg_name != "NULL")
+    release_names = [arg_name for arg_name in arg_names if arg_name != "NULL"]
 
     if to_name is not None:
         # TODO: Use context manager here too.
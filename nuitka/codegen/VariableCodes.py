@@ -336,9 +336,7 @@ def getLocalVariableDeclaration(context, variable, variable_trace):
 
         return result
     else:
-        closure_index = user.getClosureVariableIndex(variable)
-
-        return context.variable_storage.getVariableDeclarationClosure(closure_index)
+        return context.variable_storage.getVariableDeclarationClosure(variable)
 
 
 def getVariableAssignmentCode(
@@ -138,6 +138,8 @@ class VariableStorage(object):
         "heap_name",
         "variable_declarations_heap",
         "variable_declarations_main",
+        "variable_declarations_heap_by_name",
+        "variable_declarations_main_by_name",
         "variable_declarations_closure",
         "variable_declarations_locals",
         "exception_variable_declarations",
@@ -148,7 +150,12 @@ class VariableStorage(object):
 
         self.variable_declarations_heap = []
         self.variable_declarations_main = []
-        self.variable_declarations_closure = []
+        self.variable_declarations_closure = {}
+
+        # Top level declarations get looked up by name a lot, esp. for unique
+        # temporary variables, therefore index them.
+        self.variable_declarations_heap_by_name = {}
+        self.variable_declarations_main_by_name = {}
 
         self.variable_declarations_locals = []
 
@@ -170,36 +177,32 @@ class VariableStorage(object):
         self.variable_declarations_locals.pop()
 
     def getVariableDeclarationTop(self, code_name):
-        for variable_declaration in self.variable_declarations_main:
-            if variable_declaration.code_name == code_name:
-                return variable_declaration
+        result = self.variable_declarations_main_by_name.get(code_name)
 
-        for variable_declaration in self.variable_declarations_heap:
-            if variable_declaration.code_name == code_name:
-                return variable_declaration
+        if result is None:
+            result = self.variable_declarations_heap_by_name.get(code_name)
 
-        return None
+        return result
 
-    def getVariableDeclarationClosure(self, closure_index):
-        return self.variable_declarations_closure[closure_index]
+    def getVariableDeclarationClosure(self, variable):
+        return self.variable_declarations_closure[variable]
 
     def addFrameCacheDeclaration(self, frame_identifier):
         return self.addVariableDeclarationFunction(
             "static struct Nuitka_FrameObject *", "cache_%s" % frame_identifier, "NULL"
         )
 
-    def makeCStructLevelDeclarations(self):
-        return [
-            variable_declaration.makeCStructDeclaration()
-            for variable_declaration in self.variable_declarations_heap
-        ]
+    def makeCStructLevelDeclarationsAndInits(self):
+        struct_declarations = []
+        struct_inits = []
 
-    def makeCStructInits(self):
-        return [
-            variable_declaration.makeCStructInit()
-            for variable_declaration in self.variable_declarations_heap
-            if variable_declaration.init_value is not None
-        ]
+        for variable_declaration in self.variable_declarations_heap:
+            struct_declarations.append(variable_declaration.makeCStructDeclaration())
+
+            if variable_declaration.init_value is not None:
+                struct_inits.append(variable_declaration.makeCStructInit())
+
+        return struct_declarations, struct_inits
 
     def getExceptionVariableDescriptions(self):
         if self.exception_variable_declarations is None:
@@ -223,10 +226,10 @@ class VariableStorage(object):
 
         return result
 
-    def addVariableDeclarationClosure(self, c_type, code_name):
+    def addVariableDeclarationClosure(self, c_type, code_name, variable):
         result = VariableDeclaration(c_type, code_name, None, None)
 
-        self.variable_declarations_closure.append(result)
+        self.variable_declarations_closure[variable] = result
 
         return result
 
@@ -234,6 +237,7 @@ class VariableStorage(object):
         result = VariableDeclaration(c_type, code_name, init_value, None)
 
         self.variable_declarations_main.append(result)
+        self.variable_declarations_main_by_name.setdefault(code_name, result)
 
         return result
 
@@ -242,8 +246,10 @@ class VariableStorage(object):
 
         if self.heap_name is not None:
             self.variable_declarations_heap.append(result)
+            self.variable_declarations_heap_by_name.setdefault(code_name, result)
         else:
             self.variable_declarations_main.append(result)
+            self.variable_declarations_main_by_name.setdefault(code_name, result)
 
         return result
 
@@ -404,9 +404,10 @@ class CTypeCellObject(CTypeBase):
 
     @classmethod
     def getCellObjectAssignmentCode(cls, target_cell_code, variable_code_name, emit):
-        emit("%s = %s;" % (target_cell_code, variable_code_name))
-
-        emit("Py_INCREF(%s);" % (target_cell_code))
+        emit(
+            "%s = %s;\nPy_INCREF(%s);"
+            % (target_cell_code, variable_code_name, target_cell_code)
+        )
 
     @classmethod
     def emitVariableAssignCode(
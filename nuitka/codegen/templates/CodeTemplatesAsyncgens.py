@@ -61,11 +61,6 @@ static PyObject *%(asyncgen_maker_identifier)s(%(asyncgen_creation_args)s) {
 }
 """
 
-template_make_asyncgen = """\
-%(closure_copy)s
-%(to_name)s = %(asyncgen_maker_identifier)s(%(args)s);
-"""
-
 # TODO: For functions NUITKA_CANNOT_GET_HERE is injected by composing code.
 template_asyncgen_exception_exit = """\
     NUITKA_CANNOT_GET_HERE("return must be present");
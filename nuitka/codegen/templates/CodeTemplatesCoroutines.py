@@ -61,11 +61,6 @@ static PyObject *%(coroutine_maker_identifier)s(%(coroutine_creation_args)s) {
 }
 """
 
-template_make_coroutine = """\
-%(closure_copy)s
-%(to_name)s = %(coroutine_maker_identifier)s(%(args)s);
-"""
-
 # TODO: For functions NUITKA_CANNOT_GET_HERE is injected by composing code.
 template_coroutine_exception_exit = """\
     NUITKA_CANNOT_GET_HERE("Return statement must be present");
@@ -19,6 +19,10 @@
 
 """
 
+template_must_not_get_here = """\
+NUITKA_CANNOT_GET_HERE("%(reason)s");
+return NULL;"""
+
 template_publish_exception_to_handler = """\
 if (%(keeper_tb)s == NULL) {
     %(keeper_tb)s = %(tb_making)s;
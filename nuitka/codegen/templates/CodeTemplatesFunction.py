@@ -52,9 +52,10 @@ static PyObject *%(function_maker_identifier)s(%(function_creation_args)s) {
 }
 """
 
+# Used for making functions, generators, coroutines, and asyncgens alike.
 template_make_function = """\
 %(closure_copy)s
-%(to_name)s = %(function_maker_identifier)s(%(args)s);
+%(to_name)s = %(maker_identifier)s(%(args)s);
 """
 
 template_function_body = """\
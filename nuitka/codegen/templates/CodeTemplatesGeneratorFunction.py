@@ -64,11 +64,6 @@ static PyObject *%(generator_maker_identifier)s(%(generator_creation_args)s) {
 }
 """
 
-template_make_generator = """\
-%(closure_copy)s
-%(to_name)s = %(generator_maker_identifier)s(%(args)s);
-"""
-
 template_make_empty_generator = """\
 %(closure_copy)s
 %(to_name)s = Nuitka_Generator_NewEmpty(
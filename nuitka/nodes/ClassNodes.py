@@ -112,7 +112,7 @@ class ExpressionClassBody(MarkNeedsAnnotationsMixin, ExpressionOutlineFunctionBa
                 )
         else:
             result = self.provider.getVariableForClosure(variable_name)
-            self.taken.add(result)
+            self.addClosureVariable(result)
             return result
 
     def markAsDirectlyCalled(self):
@@ -86,6 +86,7 @@ class ExpressionFunctionBodyBase(
     __slots__ = (
         "provider",
         "taken",
+        "closure_variables",
         "name",
         "code_prefix",
         "code_name",
@@ -233,6 +234,7 @@ class ExpressionFunctionBodyBase(
         self.locals_scope.unregisterClosureVariable(variable)
 
         self.taken.remove(variable)
+        self.closure_variables = None
 
         self.code_object.removeFreeVarname(variable.getName())
 
@@ -240,6 +242,7 @@ class ExpressionFunctionBodyBase(
         assert variable.isLocalVariable()
 
         self.taken.remove(variable)
+        self.closure_variables = None
 
         assert variable.getOwner() is not self
 
@@ -310,7 +313,7 @@ class ExpressionFunctionBodyBase(
 
     def takeVariableForClosure(self, variable_name):
         result = self.provider.getVariableForClosure(variable_name)
-        self.taken.add(result)
+        self.addClosureVariable(result)
         return result
 
     def createProvidedVariable(self, variable_name):
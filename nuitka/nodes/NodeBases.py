@@ -821,6 +821,10 @@ class ClosureTakerMixin(object):
 
         self.taken = set()
 
+        # Sorted closure variables, computed on demand, and reset whenever the
+        # taken variables change.
+        self.closure_variables = None
+
     def getParentVariableProvider(self):
         return self.provider
 
@@ -835,16 +839,20 @@ class ClosureTakerMixin(object):
 
     def addClosureVariable(self, variable):
         self.taken.add(variable)
+        self.closure_variables = None
 
         return variable
 
     def getClosureVariables(self):
-        return tuple(
-            sorted(
-                [take for take in self.taken if not take.isModuleVariable()],
-                key=lambda x: x.getName(),
+        if self.closure_variables is None:
+            self.closure_variables = tuple(
+                sorted(
+                    [take for take in self.taken if not take.isModuleVariable()],
+                    key=lambda x: x.getName(),
+                )
             )
-        )
+
+        return self.closure_variables
 
     def getClosureVariableIndex(self, variable):
         closure_variables = self.getClosureVariables()